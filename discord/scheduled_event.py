@@ -24,8 +24,10 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
-from typing import TYPE_CHECKING, AsyncIterator, Dict, Optional, Union
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 from .asset import Asset
 from .enums import EventStatus, EntityType, PrivacyLevel, try_enum
@@ -38,10 +40,12 @@ if TYPE_CHECKING:
         GuildScheduledEvent as GuildScheduledEventPayload,
         GuildScheduledEventWithUserCount as GuildScheduledEventWithUserCountPayload,
         EntityMetadata,
+        ScheduledEventUser as ScheduledEventUserPayload,
     )
 
     from .abc import Snowflake
     from .channel import VoiceChannel, StageChannel
+    from .http import HTTPClient
     from .state import ConnectionState
     from .user import User
 
@@ -53,6 +57,65 @@ __all__ = (
 )
 # fmt: on
 
+_ENTITY_TYPES: Dict[int, EntityType] = EntityType._enum_value_map_
+_EVENT_STATUSES: Dict[int, EventStatus] = EventStatus._enum_value_map_
+_PRIVACY_LEVELS: Dict[int, PrivacyLevel] = PrivacyLevel._enum_value_map_
+
+_CHANNEL_ENTITY_TYPES = frozenset((EntityType.stage_instance, EntityType.voice))
+
+_REQUIRED_FIELDS = itemgetter(
+    'id',
+    'guild_id',
+    'name',
+    'entity_type',
+    'scheduled_start_time',
+    'privacy_level',
+    'status',
+    'image',
+)
+
+_dt_isoformat = datetime.isoformat
+
+
+async def _before_strategy(
+    http: HTTPClient,
+    guild_id: int,
+    event_id: int,
+    retrieve: int,
+    before: Optional[Snowflake],
+    limit: Optional[int],
+) -> Tuple[List[ScheduledEventUserPayload], Optional[Snowflake], Optional[int]]:
+    before_id = before.id if before else None
+    users = await http.get_scheduled_event_users(guild_id, event_id, limit=retrieve, with_member=False, before=before_id)
+
+    if users:
+        if limit is not None:
+            limit -= len(users)
+
+        before = Object(id=users[-1]['user']['id'])
+
+    return users, before, limit
+
+
+async def _after_strategy(
+    http: HTTPClient,
+    guild_id: int,
+    event_id: int,
+    retrieve: int,
+    after: Optional[Snowflake],
+    limit: Optional[int],
+) -> Tuple[List[ScheduledEventUserPayload], Optional[Snowflake], Optional[int]]:
+    after_id = after.id if after else None
+    users = await http.get_scheduled_event_users(guild_id, event_id, limit=retrieve, with_member=False, after=after_id)
+
+    if users:
+        if limit is not None:
+            limit -= len(users)
+
+        after = Object(id=users[0]['user']['id'])
+
+    return users, after, limit
+
 
 class ScheduledEvent(Hashable):
     """Represents a scheduled event in a guild.
@@ -83,8 +146,8 @@ class ScheduledEvent(Hashable):
         The description of the scheduled event.
     entity_type: :class:`EntityType`
         The type of entity this event is for.
-    entity_id: :class:`int`
-        The ID of the entity this event is for.
+    entity_id: Optional[:class:`int`]
+        The ID of the entity this event is for if available.
     start_time: :class:`datetime.datetime`
         The time that the scheduled event will start in UTC.
     end_time: :class:`datetime.datetime`
@@ -102,50 +165,68 @@ class ScheduledEvent(Hashable):
     """
 
     __slots__ = (
-        '_state',
-        '_users',
         'id',
         'guild_id',
-        'name',
-        'description',
-        'entity_type',
         'entity_id',
+        'channel_id',
+        'status',
+        'entity_type',
         'start_time',
         'end_time',
         'privacy_level',
-        'status',
-        '_cover_image',
+        'name',
+        'description',
+        'location',
         'user_count',
+        '_cover_image',
         'creator',
-        'channel_id',
-        'location',
+        '_state',
+        '_users',
+        '_last_image_cache',
     )
 
-    def __init__(self, *, state: ConnectionState, data: GuildScheduledEventPayload) -> None:
+    def __init__(
+        self,
+        *,
+        state: ConnectionState,
+        data: GuildScheduledEventPayload,
+        creator: Optional[User] = MISSING,
+    ) -> None:
         self._state = state
-        self._users: Dict[int, User] = {}
-        self._update(data)
+        self._users: Optional[Dict[int, User]] = None
+        self._last_image_cache: Optional[Tuple[bytes, str]] = None
+        if creator is MISSING:
+            self._update(data)
+        else:
+            self._update_common(data)
+            self.creator = creator
 
     def _update(self, data: GuildScheduledEventPayload) -> None:
-        self.id: int = int(data['id'])
-        self.guild_id: int = int(data['guild_id'])
-        self.name: str = data['name']
-        self.description: str = data.get('description', '')
-        self.entity_type = try_enum(EntityType, data['entity_type'])
-        self.entity_id: int = int(data['id'])
-        self.start_time: datetime = parse_time(data['scheduled_start_time'])
-        self.privacy_level: PrivacyLevel = try_enum(PrivacyLevel, data['status'])
-        self.status: EventStatus = try_enum(EventStatus, data['status'])
-        self._cover_image: Optional[str] = data['image']
-        self.user_count: int = data.get('user_count', 0)
+        self._update_common(data)
 
         creator = data.get('creator')
         self.creator: Optional[User] = self._state.store_user(creator) if creator else None
 
-        self.end_time: Optional[datetime] = parse_time(data.get('scheduled_end_time'))
+    def _update_common(self, data: GuildScheduledEventPayload) -> None:
+        _id, guild_id, name, entity_type, start_time, privacy_level, status, image = _REQUIRED_FIELDS(data)
+        self.id: int = int(_id)
+        self.guild_id: int = int(guild_id)
+        self.name: str = name
+        self.description: str = data.get('description', '')
+        self.entity_type = _ENTITY_TYPES.get(entity_type) or try_enum(EntityType, entity_type)
+        self.entity_id: Optional[int] = _get_as_snowflake(data, 'entity_id')
+        self.start_time: datetime = parse_time(start_time)
+        self.privacy_level: PrivacyLevel = _PRIVACY_LEVELS.get(privacy_level) or try_enum(PrivacyLevel, privacy_level)
+        self.status: EventStatus = _EVENT_STATUSES.get(status) or try_enum(EventStatus, status)
+        self._cover_image: Optional[str] = image
+        self.user_count: int = data.get('user_count', 0)
+
+        end_raw = data.get('scheduled_end_time')
+        self.end_time: Optional[datetime] = parse_time(end_raw) if end_raw else None
         self.channel_id: Optional[int] = _get_as_snowflake(data, 'channel_id')
+        self.location: Optional[str] = None
 
-        metadata = data.get('metadata')
+        metadata = data.get('entity_metadata')
         if metadata:
             self._unroll_metadata(metadata)
 
@@ -153,14 +234,24 @@ class ScheduledEvent(Hashable):
         self.location: Optional[str] = data.get('location')
 
     @classmethod
-    def from_creation(cls, *, state: ConnectionState, data: GuildScheduledEventPayload):
+    def from_creation(cls, *, state: ConnectionState, data: GuildScheduledEventPayload) -> ScheduledEvent:
+        # Prefer the cached creator and only build a new user if it isn't known yet
         creator_id = data.get('creator_id')
-        self = cls(state=state, data=data)
-        if creator_id:
-            self.creator = self._state.get_user(int(creator_id))
+        creator = state.get_user(int(creator_id)) if creator_id else None
+        if creator is None:
+            raw_creator = data.get('creator')
+            if raw_creator:
+                creator = state.store_user(raw_creator)
+
+        return cls(state=state, data=data, creator=creator)
 
     def __repr__(self) -> str:
-        return f'<GuildScheduledEvent id={self.id} name={self.name!r} guild_id={self.guild_id!r} creator={self.creator!r}>'
+        return '<GuildScheduledEvent id=%d name=%r guild_id=%d creator=%r>' % (
+            self.id,
+            self.name,
+            self.guild_id,
+            self.creator,
+        )
 
     @property
     def cover_image(self) -> Optional[Asset]:
@@ -361,11 +452,11 @@ class ScheduledEvent(Hashable):
             payload['name'] = name
 
         if start_time is not MISSING:
-            if start_time.tzinfo is None:
+            if start_time.utcoffset() is None:
                 raise ValueError(
                     'start_time must be an aware datetime. Consider using discord.utils.utcnow() or datetime.datetime.now().astimezone() for local time.'
                 )
-            payload['scheduled_start_time'] = start_time.isoformat()
+            payload['scheduled_start_time'] = _dt_isoformat(start_time)
 
         if description is not MISSING:
             payload['description'] = description
@@ -382,8 +473,20 @@ class ScheduledEvent(Hashable):
 
             payload['status'] = status.value
 
+        # A freshly encoded image is only kept if the request fails, so that the next
+        # edit can reuse it when retrying with the same bytes. Any edit releases it.
+        cached = self._last_image_cache
+        self._last_image_cache = None
+        image_to_cache: Optional[Tuple[bytes, str]] = None
         if image is not MISSING:
-            image_as_str: str = _bytes_to_base64_data(image)
+            image_as_str: str
+            if cached is not None and cached[0] is image:
+                image_as_str = cached[1]
+            else:
+                image_as_str = _bytes_to_base64_data(image)
+                # Only immutable bytes are safe to cache by identity
+                if isinstance(image, bytes):
+                    image_to_cache = (image, image_as_str)
             payload['image'] = image_as_str
 
         if entity_type is not MISSING:
@@ -394,7 +497,7 @@ class ScheduledEvent(Hashable):
 
         _entity_type = entity_type or self.entity_type
 
-        if _entity_type in (EntityType.stage_instance, EntityType.voice):
+        if _entity_type in _CHANNEL_ENTITY_TYPES:
             if channel is MISSING or channel is None:
                 raise TypeError('channel must be set when entity_type is voice or stage_instance')
 
@@ -414,16 +517,21 @@ class ScheduledEvent(Hashable):
             if end_time is MISSING:
                 raise TypeError('end_time must be set when entity_type is external')
 
-            if end_time.tzinfo is None:
+            if end_time.utcoffset() is None:
                 raise ValueError(
                     'end_time must be an aware datetime. Consider using discord.utils.utcnow() or datetime.datetime.now().astimezone() for local time.'
                 )
-            payload['scheduled_end_time'] = end_time.isoformat()
+            payload['scheduled_end_time'] = _dt_isoformat(end_time)
 
         if metadata:
             payload['entity_metadata'] = metadata
 
-        data = await self._state.http.edit_scheduled_event(self.guild_id, self.id, **payload, reason=reason)
+        try:
+            data = await self._state.http.edit_scheduled_event(self.guild_id, self.id, **payload, reason=reason)
+        except Exception:
+            self._last_image_cache = image_to_cache
+            raise
+
         s = ScheduledEvent(state=self._state, data=data)
         s._users = self._users
         return s
@@ -475,34 +583,6 @@ class ScheduledEvent(Hashable):
             All thread members in the thread.
         """
 
-        async def _before_strategy(retrieve, before, limit):
-            before_id = before.id if before else None
-            users = await self._state.http.get_scheduled_event_users(
-                self.guild_id, self.id, limit=retrieve, with_member=False, before=before_id
-            )
-
-            if users:
-                if limit is not None:
-                    limit -= len(users)
-
-                before = Object(id=users[-1]['user']['id'])
-
-            return users, before, limit
-
-        async def _after_strategy(retrieve, after, limit):
-            after_id = after.id if after else None
-            users = await self._state.http.get_scheduled_event_users(
-                self.guild_id, self.id, limit=retrieve, with_member=False, after=after_id
-            )
-
-            if users:
-                if limit is not None:
-                    limit -= len(users)
-
-                after = Object(id=users[0]['user']['id'])
-
-            return users, after, limit
-
         if limit is None:
             limit = self.user_count or None
 
@@ -511,39 +591,73 @@ class ScheduledEvent(Hashable):
         else:
             reverse = oldest_first
 
-        predicate = None
+        # Users on the wrong side of the cutoff are skipped, i.e. those with
+        # (id - cutoff) * cutoff_mode >= 0. A mode of 0 disables the check.
+        cutoff = 0
+        cutoff_mode = 0
 
         if reverse:
             strategy, state = _after_strategy, after
             if before:
-                predicate = lambda u: u['user']['id'] < before.id
+                cutoff, cutoff_mode = before.id, 1
         else:
             strategy, state = _before_strategy, before
             if after and after != OLDEST_OBJECT:
-                predicate = lambda u: u['user']['id'] > after.id
-
-        while True:
-            retrieve = min(100 if limit is None else limit, 100)
-            if retrieve < 1:
-                return
-
-            data, state, limit = await strategy(retrieve, state, limit)
-
-            if len(data) < 100:
-                limit = 0
-
-            if reverse:
-                data = reversed(data)
-            if predicate:
-                data = filter(predicate, data)
-
-            users = (self._state.store_user(raw_user['user']) for raw_user in data)
-
-            for user in users:
-                yield user
+                cutoff, cutoff_mode = after.id, -1
+
+        http = self._state.http
+        store_user = self._state.store_user
+        guild_id = self.guild_id
+        event_id = self.id
+
+        retrieve = min(100 if limit is None else limit, 100)
+        if retrieve < 1:
+            return
+
+        data, state, limit = await strategy(http, guild_id, event_id, retrieve, state, limit)
+
+        # The next page is requested before the current one is handed out so that
+        # the round trip overlaps with whatever the consumer does with each user.
+        next_page: Optional[asyncio.Task[Any]] = None
+        try:
+            while True:
+                if len(data) < 100:
+                    limit = 0
+
+                retrieve = min(100 if limit is None else limit, 100)
+                if retrieve >= 1:
+                    next_page = asyncio.create_task(strategy(http, guild_id, event_id, retrieve, state, limit))
+
+                if reverse:
+                    indices = range(len(data) - 1, -1, -1)
+                else:
+                    indices = range(len(data))
+
+                for i in indices:
+                    raw_user = data[i]['user']
+                    if cutoff_mode and (int(raw_user['id']) - cutoff) * cutoff_mode >= 0:
+                        continue
+
+                    yield store_user(raw_user)
+
+                if next_page is None:
+                    return
+
+                task, next_page = next_page, None
+                data, state, limit = await task
+        finally:
+            if next_page is not None:
+                if not next_page.done():
+                    next_page.cancel()
+                elif not next_page.cancelled():
+                    # Mark any error as retrieved since nobody will await it
+                    next_page.exception()
 
     def _add_user(self, user: User) -> None:
+        if self._users is None:
+            self._users = {}
         self._users[user.id] = user
 
     def _pop_user(self, user_id: int) -> None:
-        self._users.pop(user_id)
+        if self._users is not None:
+            self._users.pop(user_id, None)
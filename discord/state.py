@@ -1313,7 +1313,7 @@ class ConnectionState:
     def parse_guild_scheduled_event_create(self, data: gw.GuildScheduledEventCreateEvent) -> None:
         guild = self._get_guild(int(data['guild_id']))
         if guild is not None:
-            scheduled_event = ScheduledEvent(state=self, data=data)
+            scheduled_event = ScheduledEvent.from_creation(state=self, data=data)
             guild._scheduled_events[scheduled_event.id] = scheduled_event
             self.dispatch('scheduled_event_create', guild, scheduled_event)
         else:
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+"""
+
+Tests for discord.scheduled_event
+
+"""
+
+import asyncio
+import datetime
+
+import pytest
+
+from discord.enums import EntityType, EventStatus, PrivacyLevel
+from discord.object import Object
+from discord import scheduled_event
+from discord.scheduled_event import ScheduledEvent
+
+
+class FakeHTTP:
+    def __init__(self, user_ids):
+        # Pages are returned newest first, like the API does
+        self.user_ids = sorted(user_ids, reverse=True)
+        self.calls = 0
+        # Optional coroutine function awaited in place of every page after the first
+        self.next_page = None
+        self.edits = []
+        self.edit_error = None
+
+    async def get_scheduled_event_users(self, guild_id, event_id, *, limit, with_member, before=None, after=None):
+        self.calls += 1
+        if self.calls > 1 and self.next_page is not None:
+            await self.next_page()
+
+        user_ids = self.user_ids
+        if before is not None:
+            user_ids = [user_id for user_id in user_ids if user_id < before][:limit]
+        elif after is not None:
+            user_ids = [user_id for user_id in user_ids if user_id > after][-limit:]
+        else:
+            user_ids = user_ids[:limit]
+
+        return [{'user': {'id': str(user_id)}} for user_id in user_ids]
+
+    async def edit_scheduled_event(self, guild_id, event_id, *, reason=None, **payload):
+        self.edits.append(payload)
+        if self.edit_error is not None:
+            raise self.edit_error
+
+        return make_payload()
+
+
+class FakeState:
+    def __init__(self, user_ids=()):
+        self.users = {}
+        self.http = FakeHTTP(user_ids)
+
+    def store_user(self, data):
+        user_id = int(data['id'])
+        self.users[user_id] = data
+        return data
+
+    def get_user(self, user_id):
+        return self.users.get(user_id)
+
+
+def make_payload(**fields):
+    data = {
+        'id': '1000',
+        'guild_id': '2000',
+        'name': 'Event',
+        'entity_type': 3,
+        'entity_id': None,
+        'scheduled_start_time': '2022-01-01T00:00:00+00:00',
+        'scheduled_end_time': '2022-01-01T01:00:00+00:00',
+        'privacy_level': 2,
+        'status': 1,
+        'image': None,
+        'channel_id': None,
+        'entity_metadata': {'location': 'Somewhere'},
+    }
+    data.update(fields)
+    return data
+
+
+@pytest.mark.parametrize(
+    ('entity_id', 'expected'),
+    [
+        (None, None),
+        ('3000', 3000),
+    ],
+)
+def test_scheduled_event_entity_id(entity_id, expected):
+    event = ScheduledEvent(state=FakeState(), data=make_payload(entity_id=entity_id))  # type: ignore
+
+    assert event.entity_id == expected
+
+
+def test_scheduled_event_enums():
+    event = ScheduledEvent(state=FakeState(), data=make_payload(privacy_level=2, status=1))  # type: ignore
+
+    assert event.entity_type is EntityType.external
+    assert event.privacy_level is PrivacyLevel.guild_only
+    assert event.status is EventStatus.scheduled
+
+    event = ScheduledEvent(state=FakeState(), data=make_payload(entity_type=99))  # type: ignore
+
+    assert event.entity_type.value == 99
+
+
+def test_scheduled_event_location():
+    event = ScheduledEvent(state=FakeState(), data=make_payload())  # type: ignore
+
+    assert event.location == 'Somewhere'
+
+    data = make_payload(entity_type=2, channel_id='4000', entity_metadata=None)
+    event = ScheduledEvent(state=FakeState(), data=data)  # type: ignore
+
+    assert event.location is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('kwargs', 'expected'),
+    [
+        ({}, list(range(250, 0, -1))),
+        ({'limit': 3}, [250, 249, 248]),
+        ({'after': Object(id=50), 'before': Object(id=60)}, list(range(51, 60))),
+        ({'after': Object(id=55), 'before': Object(id=60), 'oldest_first': False}, [59, 58, 57, 56]),
+    ],
+)
+async def test_scheduled_event_users(kwargs, expected):
+    state = FakeState(user_ids=range(1, 251))
+    event = ScheduledEvent(state=state, data=make_payload(user_count=250))  # type: ignore
+
+    users = [int(user['id']) async for user in event.users(**kwargs)]
+
+    assert users == expected
+
+
+def _prefetch_task():
+    tasks = asyncio.all_tasks() - {asyncio.current_task()}
+    assert len(tasks) == 1
+    return tasks.pop()
+
+
+@pytest.mark.asyncio
+async def test_scheduled_event_users_close_cancels_prefetch():
+    state = FakeState(user_ids=range(1, 251))
+    state.http.next_page = asyncio.Event().wait
+    event = ScheduledEvent(state=state, data=make_payload(user_count=250))  # type: ignore
+
+    users = event.users()
+    async for user in users:
+        break
+
+    task = _prefetch_task()
+    assert not task.done()
+
+    await users.aclose()
+    await asyncio.sleep(0)
+
+    assert task.cancelled()
+
+
+async def _fail():
+    raise RuntimeError('page failed')
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('outcome', ['cancelled', 'failed'])
+async def test_scheduled_event_users_close_after_prefetch_finished(outcome):
+    state = FakeState(user_ids=range(1, 251))
+    state.http.next_page = asyncio.Event().wait if outcome == 'cancelled' else _fail
+    event = ScheduledEvent(state=state, data=make_payload(user_count=250))  # type: ignore
+
+    users = event.users()
+    async for user in users:
+        break
+
+    task = _prefetch_task()
+    if outcome == 'cancelled':
+        task.cancel()
+
+    await asyncio.sleep(0)
+    assert task.done()
+
+    await users.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scheduled_event_edit_image_cache(monkeypatch):
+    encoded = []
+
+    def encode(data):
+        encoded.append(data)
+        return 'encoded'
+
+    monkeypatch.setattr(scheduled_event, '_bytes_to_base64_data', encode)
+
+    state = FakeState()
+    event = ScheduledEvent(state=state, data=make_payload())  # type: ignore
+    image = b'image'
+    end_time = datetime.datetime(2022, 1, 1, 1, tzinfo=datetime.timezone.utc)
+
+    # Failing local validation never keeps the encoded image
+    with pytest.raises(TypeError):
+        await event.edit(image=image, channel=Object(id=1))
+
+    assert event._last_image_cache is None
+    assert len(encoded) == 1
+
+    # A failed request keeps it for the retry
+    state.http.edit_error = RuntimeError('request failed')
+    with pytest.raises(RuntimeError):
+        await event.edit(image=image, location='Elsewhere', end_time=end_time)
+
+    assert event._last_image_cache is not None
+    assert len(encoded) == 2
+
+    # The retry reuses the encoding and releases it
+    state.http.edit_error = None
+    edited = await event.edit(image=image, location='Elsewhere', end_time=end_time)
+
+    assert len(encoded) == 2
+    assert state.http.edits[-1]['image'] == 'encoded'
+    assert event._last_image_cache is None
+    assert edited._last_image_cache is None
+
+
+def test_scheduled_event_from_creation():
+    cached = {'id': '5000', 'username': 'cached'}
+    nested = {'id': '5000', 'username': 'nested'}
+
+    # Resolved from the user cache
+    state = FakeState()
+    state.users[5000] = cached
+    event = ScheduledEvent.from_creation(state=state, data=make_payload(creator_id='5000', creator=nested))  # type: ignore
+
+    assert isinstance(event, ScheduledEvent)
+    assert event.creator is cached
+
+    # Falls back to the nested creator object
+    state = FakeState()
+    event = ScheduledEvent.from_creation(state=state, data=make_payload(creator_id='5000', creator=nested))  # type: ignore
+
+    assert event.creator is nested
+    assert state.users[5000] is nested
+
+    # Neither is available
+    event = ScheduledEvent.from_creation(state=FakeState(), data=make_payload(creator_id='5000'))  # type: ignore
+
+    assert event.creator is None
+    assert event.location == 'Somewhere'